@@ -1,7 +1,4 @@
 """Instagram Scraper - Configuration with IPRoyal Support"""
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from shared.config_helper import load_actor_config
 
 def load_config():
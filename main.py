@@ -1,44 +1,87 @@
 """Instagram Scraper - Main Entry Point"""
-import asyncio, logging, sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+import asyncio, logging, sys, threading
 from scraper import InstagramScraper
 from config import load_config
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+log = logging.getLogger("instagram_scraper")
 
-async def main():
-    examples = {
-        "1": {"name": "NASA profile", "input": {"username": "nasa", "scrape_type": "profile"}},
-        "2": {"name": "NASA posts", "input": {"username": "nasa", "scrape_type": "posts", "max_posts": 20}},
-        "3": {"name": "Custom username", "input": {"username": "natgeo", "scrape_type": "profile"}},
-    }
+EXAMPLES = {
+    "1": {"name": "NASA profile", "input": {"username": "nasa", "scrape_type": "profile"}},
+    "2": {"name": "NASA posts", "input": {"username": "nasa", "scrape_type": "posts", "max_posts": 20}},
+    "3": {"name": "Custom username", "input": {"username": "natgeo", "scrape_type": "profile"}},
+}
 
-    print("\n" + "="*60 + "\nInstagram Scraper\n" + "="*60)
-    print("\n⚠️  IMPORTANT: Requires residential proxies + login session for full access")
-    print("\nSelect an example:"), [print(f"  {k}. {v['name']}") for k, v in examples.items()]
+async def ainput(prompt):
+    """input() on a daemon thread so the event loop keeps running (and Ctrl-C doesn't wait on stdin)"""
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
 
-    choice = input("\nChoice (1-3): ").strip()
-    input_data = examples.get(choice, examples["1"])["input"]
+    def _resolve(value, error):
+        if future.done():
+            return
+        if error:
+            future.set_exception(error)
+        else:
+            future.set_result(value)
 
-    config = load_config()
+    def _read():
+        try:
+            value, error = input(prompt), None
+        except Exception as e:
+            value, error = None, e
+        loop.call_soon_threadsafe(_resolve, value, error)
+
+    threading.Thread(target=_read, daemon=True).start()
+    return await future
+
+async def main(config=None):
+    # The banner and menu are only for interactive terminals; piped runs just read the choice
+    if sys.stdout.isatty():
+        print("\n" + "="*60 + "\nInstagram Scraper\n" + "="*60)
+        print("\n⚠️  IMPORTANT: Requires residential proxies + login session for full access")
+        print("\nSelect an example:"), [print(f"  {k}. {v['name']}") for k, v in EXAMPLES.items()]
+
+    # Wait for the user's choice while config + scraper setup proceed in parallel
+    choice_task = asyncio.create_task(ainput("\nChoice (1-3): "))
+    config = config or await asyncio.to_thread(load_config)
     scraper = InstagramScraper(proxy_config=config['proxy'], rate_limit=config['rate_limit'],
                                cache_config=config['cache'], output_dir=config['output_dir'])
 
+    choice = (await choice_task).strip()
+    input_data = EXAMPLES.get(choice, EXAMPLES["1"])["input"]
+
+    async with scraper:
+        try:
+            results = await scraper.run(input_data, export_formats=['json'])
+            log.info("Scraped %d items", len(results))
+            if results and 'username' in results[0]:
+                profile = results[0]
+                log.info("Profile: @%s | Followers: %s | Posts: %s", profile['username'],
+                         f"{profile['follower_count']:,}", f"{profile['post_count']:,}")
+        except Exception as e:
+            log.error("Error: %s", e)
+            log.error("Troubleshooting: 1. Configure residential proxies in .env | "
+                      "2. Add login_session cookies for private profiles | "
+                      "3. Respect Instagram's rate limits (40 req/hour)")
+
+def run(coro, use_uvloop=True):
+    """Run the coroutine on a uvloop event loop when enabled and installed"""
     try:
-        results = await scraper.run(input_data, export_formats=['json'])
-        print(f"\n✓ Scraped {len(results)} items")
-        if results and 'username' in results[0]:
-            profile = results[0]
-            print(f"\nProfile: @{profile['username']}")
-            print(f"  Followers: {profile['follower_count']:,}")
-            print(f"  Posts: {profile['post_count']:,}")
-    except Exception as e:
-        print(f"\n✗ Error: {e}")
-        print("\nTroubleshooting:")
-        print("  1. Configure residential proxies in .env")
-        print("  2. Add login_session cookies for private profiles")
-        print("  3. Respect Instagram's rate limits (40 req/hour)")
+        import uvloop
+    except ImportError:
+        uvloop = None
+
+    if not (use_uvloop and uvloop):
+        return asyncio.run(coro)
+    if sys.version_info >= (3, 11):
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            return runner.run(coro)
+    uvloop.install()
+    return asyncio.run(coro)
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    config = load_config()
+    # force=True: shared.base_actor already configured the root logger at INFO on import
+    logging.basicConfig(level=config['log_level'].upper(), format='%(asctime)s - %(levelname)s - %(message)s',
+                        force=True)
+    run(main(config), use_uvloop=config['use_uvloop'])
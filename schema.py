@@ -2,8 +2,32 @@
 Instagram Scraper - Input/Output Schemas
 """
 
-from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, Field, validator
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Optional, List, Dict, Any, Literal, Tuple
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, TypeAdapter
+
+logger = logging.getLogger(__name__)
+
+# Options that only matter when posts are scraped
+_POST_ONLY_FIELDS = frozenset({'max_posts', 'include_comments', 'max_comments_per_post', 'date_from', 'date_to'})
+
+
+def _parse_date_bound(value: Optional[str], end_of_day: bool = False) -> Optional[int]:
+    """Parse a YYYY-MM-DD (or ISO datetime) bound into unix seconds (UTC)"""
+    if not value:
+        return None
+
+    dt = datetime.fromisoformat(value)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+
+    # A bare date as upper bound includes that whole day
+    if end_of_day and len(value) == 10:
+        dt += timedelta(days=1, seconds=-1)
+
+    return int(dt.timestamp())
 
 
 class InstagramScraperInput(BaseModel):
@@ -17,10 +41,10 @@ class InstagramScraperInput(BaseModel):
     username: Optional[str] = Field(
         None,
         description="Instagram username (without @)",
-        example="nasa"
+        examples=["nasa"]
     )
 
-    scrape_type: str = Field(
+    scrape_type: Literal['profile', 'posts', 'reels', 'hashtag', 'location'] = Field(
         "profile",
         description="Type: profile, posts, reels, hashtag, location"
     )
@@ -59,38 +83,70 @@ class InstagramScraperInput(BaseModel):
         description="Login cookies for authenticated access"
     )
 
-    @validator('scrape_type')
-    def validate_scrape_type(cls, v):
-        valid = ['profile', 'posts', 'reels', 'hashtag', 'location']
-        if v not in valid:
-            raise ValueError(f"scrape_type must be one of: {valid}")
-        return v
+    cache_ttl: int = Field(
+        300,
+        ge=0,
+        description="Reuse identical API responses from memory for this many seconds (0 = off)"
+    )
+
+    # Date bounds pre-parsed once to unix seconds for cheap per-post checks
+    _date_from_ts: Optional[int] = PrivateAttr(None)
+    _date_to_ts: Optional[int] = PrivateAttr(None)
 
     def model_post_init(self, __context):
         if not self.urls and not self.username:
             raise ValueError("Either 'urls' or 'username' must be provided")
 
+        if self.scrape_type == 'profile':
+            ignored = sorted(_POST_ONLY_FIELDS & self.model_fields_set)
+            if ignored:
+                logger.warning(f"scrape_type='profile' ignores post options: {ignored}")
 
-class InstagramComment(BaseModel):
-    """Instagram comment schema"""
+        self._date_from_ts = _parse_date_bound(self.date_from)
+        self._date_to_ts = _parse_date_bound(self.date_to, end_of_day=True)
+
+    def timestamp_in_range(self, timestamp: int) -> bool:
+        """Check a unix timestamp against the date_from/date_to filter"""
+        if self._date_from_ts is not None and timestamp < self._date_from_ts:
+            return False
+        if self._date_to_ts is not None and timestamp > self._date_to_ts:
+            return False
+        return True
+
+    def timestamp_before_range(self, timestamp: int) -> bool:
+        """Check whether a unix timestamp is older than the date_from bound"""
+        return self._date_from_ts is not None and timestamp < self._date_from_ts
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class InstagramComment:
+    """
+    Instagram comment schema
+
+    Comments are the highest-cardinality record, so this is a slotted
+    dataclass rather than a BaseModel; it is validated via COMMENTS_ADAPTER.
+    """
     comment_id: str
     text: str
     author_username: str
     author_verified: bool = False
-    timestamp: str
+    timestamp: Optional[datetime] = None  # UTC
     likes: int = 0
     replies_count: int = 0
 
 
 class InstagramPost(BaseModel):
     """Instagram post schema"""
+    model_config = ConfigDict(frozen=True)
+
     shortcode: str  # Post ID
     type: str  # image, video, carousel
     caption: str = ""
-    hashtags: List[str] = []
-    mentions: List[str] = []
-    tagged_users: List[str] = []
-    timestamp: str
+    # Tuples of interned strings - tags repeat heavily across posts
+    hashtags: Tuple[str, ...] = ()
+    mentions: Tuple[str, ...] = ()
+    tagged_users: Tuple[str, ...] = ()
+    timestamp: Optional[datetime] = None  # UTC
     likes: int
     comments_count: int
     video_views: Optional[int] = None
@@ -118,8 +174,9 @@ class InstagramProfile(BaseModel):
     profile_pic_url: str
     profile_pic_url_hd: Optional[str] = None
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "username": "nasa",
                 "full_name": "NASA",
@@ -131,3 +188,10 @@ class InstagramProfile(BaseModel):
                 "is_private": False
             }
         }
+    )
+
+
+# Module-level adapters validate whole batches in a single pydantic-core pass
+POSTS_ADAPTER = TypeAdapter(List[InstagramPost])
+COMMENTS_ADAPTER = TypeAdapter(List[InstagramComment])
+COMMENT_ADAPTER = TypeAdapter(InstagramComment)
@@ -7,25 +7,168 @@ import asyncio
 import logging
 import re
 import json
-from typing import Dict, Any, List, Optional
-from datetime import datetime
+from typing import Dict, Any, List, Mapping, Optional, Tuple, Iterable, Awaitable, AsyncIterator
+from datetime import datetime, timezone
+from itertools import islice
+from types import MappingProxyType
 import sys
-from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
-from scrapling import StealthyFetcher, DynamicFetcher
+import aiohttp
+from scrapling import DynamicFetcher
 from shared.base_actor import BaseActor
-from shared.utils import retry_with_backoff
+from shared.utils import retry_with_backoff, MemoryCache
+from pydantic import ValidationError
 from schema import (
     InstagramScraperInput,
     InstagramProfile,
     InstagramPost,
-    InstagramComment
+    InstagramComment,
+    POSTS_ADAPTER,
+    COMMENTS_ADAPTER,
+    COMMENT_ADAPTER
 )
 
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON decoding/encoding
+    orjson = None
+
+try:
+    from playwright.async_api import TimeoutError as BrowserTimeoutError
+except ImportError:  # Playwright ships with scrapling[fetchers]; only the browser fallback needs it
+    BrowserTimeoutError = asyncio.TimeoutError
+
+try:
+    import simdjson
+except ImportError:  # Optional: lazy field access on large GraphQL payloads
+    simdjson = None
+
 logger = logging.getLogger(__name__)
 
+if orjson is not None:
+    _loads = orjson.loads
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+else:
+    _loads = json.loads
+    _dumps = json.dumps
+
+
+def _parse_response(body: bytes) -> Any:
+    """
+    Parse a GraphQL response body
+
+    With pysimdjson installed the document is returned as lazy proxies, so
+    only the fields the parsers actually read are turned into Python objects.
+    """
+    if simdjson is not None:
+        # One parser per document: a shared parser can't be reused while another
+        # in-flight target still holds proxies into the previous document
+        return simdjson.Parser().parse(body)
+    return _loads(body)
+
+
+class InstagramHTTPError(Exception):
+    """Unexpected HTTP status from Instagram"""
+
+    def __init__(self, status: int, message: str = "Request failed"):
+        super().__init__(f"{message} (HTTP {status})")
+        self.status = status
+
+
+class RateLimited(InstagramHTTPError):
+    """429 - back off and retry"""
+
+
+class AuthRequired(InstagramHTTPError):
+    """401 - retrying won't help without a (valid) login session"""
+
+
+class ServerError(InstagramHTTPError):
+    """5xx - transient, retry"""
+
+
+class ClientError(InstagramHTTPError):
+    """Other 4xx (checkpoint, unknown user, bad request) - retrying won't help"""
+
+
+_STATUS = {
+    429: (RateLimited, "Rate limited by Instagram - need to wait"),
+    401: (AuthRequired, "Unauthorized - login session required"),
+    500: (ServerError, "Instagram server error"),
+    502: (ServerError, "Instagram server error"),
+    503: (ServerError, "Instagram server error"),
+    504: (ServerError, "Instagram server error"),
+}
+
+
+# Only RateLimited/ServerError (and transport errors) are worth retrying
+_NON_RETRYABLE = (AuthRequired, ClientError)
+
+
+def _check(status: int) -> None:
+    """Raise the typed error for a non-200 status"""
+    if status == 200:
+        return
+    if status in _STATUS:
+        exc, message = _STATUS[status]
+    elif 400 <= status < 500:
+        exc, message = ClientError, "Request rejected by Instagram"
+    elif status >= 500:
+        exc, message = ServerError, "Instagram server error"
+    else:
+        exc, message = InstagramHTTPError, "Request failed"
+    raise exc(status, message)
+
+
+_UTC = timezone.utc
+
+# Shared read-only defaults for the .get() chains in the response parsers,
+# so a missing key doesn't allocate a fresh {} / [] on every lookup
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+
+def _ts_to_dt(ts: int) -> Optional[datetime]:
+    """Convert a unix timestamp to an aware UTC datetime (None when missing)"""
+    return datetime.fromtimestamp(ts, _UTC) if ts else None
+
+
+# Hashtags and mentions are pulled from captions in a single pass; the lookbehind
+# skips email addresses and URL fragments (press@nasa.gov, nasa.gov/#artemis)
+_CAPTION_TAG_RE = re.compile(r'(?<![\w@#/])(?:#(?P<hashtag>\w+)|@(?P<mention>\w(?:[\w.]*\w)?))')
+
+# URL and browser-HTML patterns, compiled once at import
+_USERNAME_RE = re.compile(r'instagram\.com/([^/?]+)')
+_SHORTCODE_RE = re.compile(r'/p/([^/?]+)')
+_SHARED_DATA_RE = re.compile(r'window\._sharedData\s*=\s*({.*?});', re.DOTALL)
+# Post links on a rendered profile page (browser fallback)
+_POST_LINK_SELECTOR = 'article a[href*="/p/"]'
+_POST_LINK_COUNT_JS = f"document.querySelectorAll('{_POST_LINK_SELECTOR}').length"
+
+# One pass over the page HTML for all og:* meta tags, and one for both counts
+_OG_META_RE = re.compile(r'<meta property="og:(?P<prop>description|image|video)" content="(?P<value>[^"]*)"')
+_COUNTS_RE = re.compile(r'(?P<count>\d+(?:,\d+)*)\s*(?P<kind>like|comment)', re.I)
+
+
+def _extract_caption_tags(caption: str) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """
+    Extract unique hashtags and mentions (in order of appearance) from a caption
+
+    Tags are lower-cased and interned so repeats across posts share one string.
+    """
+    hashtags: Dict[str, None] = {}
+    mentions: Dict[str, None] = {}
+
+    for match in _CAPTION_TAG_RE.finditer(caption):
+        hashtag = match.group('hashtag')
+        if hashtag:
+            hashtags[sys.intern(hashtag.lower())] = None
+        else:
+            mentions[sys.intern(match.group('mention').lower())] = None
+
+    return tuple(hashtags), tuple(mentions)
+
 
 class InstagramScraper(BaseActor):
     """
@@ -40,10 +183,142 @@ class InstagramScraper(BaseActor):
         - REQUIRES residential proxies + login session
     """
 
-    def __init__(self, **kwargs):
+    # Static request headers, shared read-only by every GraphQL/API call
+    _BASE_HEADERS_JSON = MappingProxyType({
+        'x-ig-app-id': '936619743392459',  # Instagram web app ID
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+        'Accept': 'application/json'
+    })
+    _BASE_HEADERS_XHR = MappingProxyType({
+        **_BASE_HEADERS_JSON,
+        'X-Requested-With': 'XMLHttpRequest'
+    })
+
+    # GraphQL query hashes (change periodically - may need updating)
+    _POSTS_QUERY_HASH = "69cba40317214236af40e7efa697781d"
+    _COMMENTS_QUERY_HASH = "bc3296d1ce80a24b1b6e40b1e72903f5"
+
+    def __init__(self, concurrency: int = 10, **kwargs):
+        """
+        Initialize Instagram scraper
+
+        Args:
+            concurrency: Maximum number of targets scraped concurrently
+            **kwargs: Passed through to BaseActor
+        """
         super().__init__(**kwargs)
         self.base_url = "https://www.instagram.com"
 
+        # Bounds how many usernames/URLs are scraped at the same time
+        self._sem = asyncio.Semaphore(concurrency)
+
+        # scrape_type -> per-target handler, resolved before any fetch is scheduled
+        self._dispatch = {
+            'profile': self._scrape_profile_target,
+            'posts': self._scrape_posts_target,
+            'reels': self._scrape_posts_target,
+        }
+
+        # Shared HTTP session - created lazily inside the running event loop
+        # and reused for every GraphQL/API request so TCP+TLS setup is paid once
+        self._session: Optional[aiohttp.ClientSession] = None
+
+        # Cookie header for the current scrape, built once from login_session
+        self._cookie_header: Optional[str] = None
+
+        # Hot in-memory tier in front of the disk cache for repeat API calls;
+        # its TTL is set per scrape from InstagramScraperInput.cache_ttl
+        self._response_cache = MemoryCache(maxsize=512)
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get (or lazily create) the connection-pooled HTTP session"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=10,  # Browser-like per-host cap, avoids connection storms
+                ttl_dns_cache=300,  # Resolve instagram.com once per 5 minutes
+                use_dns_cache=True
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=15)
+            )
+        return self._session
+
+    @staticmethod
+    def _proxy_kwargs(proxy: Optional[str | Dict[str, str]]) -> Dict[str, Any]:
+        """Convert a ProxyManager entry into aiohttp request arguments"""
+        if not proxy:
+            return {}
+
+        if isinstance(proxy, str):
+            return {'proxy': proxy}
+
+        kwargs: Dict[str, Any] = {'proxy': proxy['server']}
+
+        # Credentials may already be embedded in the server URL (IPRoyal)
+        username = proxy.get('username')
+        if username and '@' not in proxy['server']:
+            kwargs['proxy_auth'] = aiohttp.BasicAuth(username, proxy.get('password', ''))
+
+        return kwargs
+
+    async def _fetch(
+        self,
+        url: str,
+        headers: Mapping[str, str],
+        proxy: Optional[str | Dict[str, str]] = None
+    ) -> Tuple[int, bytes, bool]:
+        """
+        Fetch a URL through the shared session
+
+        Responses are looked up (keyed by URL + session cookie) in memory and,
+        when enabled, on disk first; cache hits skip both the network and rate
+        limiter. Storing is left to _store_response once the body has parsed.
+
+        Returns:
+            Tuple of (HTTP status, raw response body, served from cache)
+        """
+        cookie = headers.get('Cookie', '')
+        memory_key = (url, cookie)
+        body = self._response_cache.get(memory_key)
+        if body is not None:
+            return 200, body, True
+
+        if self.cache:
+            cache_key = self.cache.make_key(url, cookie=cookie)
+            # Cache reads/writes are blocking file I/O; keep them off the event loop
+            cached = await asyncio.to_thread(self.get_from_cache, cache_key)
+            if cached is not None:
+                body = cached.encode('utf-8')
+                self._response_cache.set(memory_key, body)
+                return 200, body, True
+
+        await self.rate_limit()
+
+        session = await self._get_session()
+
+        async with session.get(url, headers=headers, **self._proxy_kwargs(proxy)) as response:
+            status, body = response.status, await response.read()
+
+        return status, body, False
+
+    async def _store_response(self, url: str, headers: Mapping[str, str], body: bytes) -> None:
+        """Cache a response body that has already been checked and parsed (memory + disk)"""
+        self._response_cache.set((url, headers.get('Cookie', '')), body)
+
+        if self.cache:
+            cache_key = self.cache.make_key(url, cookie=headers.get('Cookie', ''))
+            await asyncio.to_thread(self.save_to_cache, cache_key, body.decode('utf-8'))
+
+    async def cleanup(self) -> None:
+        """Close the shared HTTP session"""
+        await super().cleanup()
+
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
     def validate_input(self, input_data: Dict[str, Any]) -> bool:
         """Validate input using Pydantic schema"""
         try:
@@ -58,287 +333,436 @@ class InstagramScraper(BaseActor):
 
         logger.info(f"Starting Instagram scrape: {config.scrape_type}")
 
-        # Determine username
-        username = config.username
-        if config.urls and not username:
-            # Extract username from URL
-            username = self._extract_username_from_url(config.urls[0])
+        self._cookie_header = self._build_cookie_header(config.login_session)
+        self._response_cache.ttl = config.cache_ttl
 
-        results = []
+        usernames = self._resolve_usernames(config)
 
-        if config.scrape_type == 'profile':
-            # Scrape profile info
-            profile = await self._scrape_profile(username, config.login_session)
-            results = [profile.model_dump()]
-
-        elif config.scrape_type in ['posts', 'reels']:
-            # Scrape posts
-            posts = await self._scrape_posts(
-                username,
-                config.max_posts,
-                config.login_session
-            )
+        # Fan out across targets, bounded by the concurrency semaphore
+        target_results = await self._run_batch(
+            self._scrape_target_with_sem(username, config) for username in usernames
+        )
 
-            if config.include_comments:
-                posts = await self._scrape_comments_batch(
-                    posts,
-                    config.max_comments_per_post
-                )
+        results = []
+        errors = []
+        for username, result in zip(usernames, target_results):
+            if isinstance(result, Exception):
+                logger.error(f"Error scraping @{username}: {result}")
+                errors.append(result)
+            else:
+                results.extend(result)
 
-            results = [post.model_dump() for post in posts]
+        # Surface the failure when nothing could be scraped at all
+        if errors and len(errors) == len(usernames):
+            raise errors[0]
 
         logger.info(f"Scraped {len(results)} items from Instagram")
 
         return results
 
+    async def iter_scrape(self, input_data: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+        """Yield records per target as soon as each target finishes"""
+        config = InstagramScraperInput(**input_data)
+
+        logger.info(f"Starting streaming Instagram scrape: {config.scrape_type}")
+
+        self._cookie_header = self._build_cookie_header(config.login_session)
+        self._response_cache.ttl = config.cache_ttl
+
+        usernames = self._resolve_usernames(config)
+        tasks = [
+            asyncio.ensure_future(self._scrape_target_with_sem(username, config))
+            for username in usernames
+        ]
+
+        count = 0
+        errors = []
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                try:
+                    items = await next_done
+                except Exception as e:
+                    logger.error(f"Error scraping target: {e}")
+                    errors.append(e)
+                    continue
+
+                for item in items:
+                    count += 1
+                    yield item
+        finally:
+            # Consumer stopped early (or failed) - don't leave targets running
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        # Surface the failure when nothing could be scraped at all
+        if errors and len(errors) == len(usernames):
+            raise errors[0]
+
+        logger.info(f"Scraped {count} items from Instagram")
+
+    def _headers(self, base: Mapping[str, str]) -> Mapping[str, str]:
+        """Return request headers, copying the base only when a session cookie is added"""
+        if self._cookie_header:
+            return {**base, 'Cookie': self._cookie_header}
+        return base
+
+    @staticmethod
+    def _build_cookie_header(login_session: Optional[Dict[str, str]]) -> Optional[str]:
+        """Format login_session cookies as a single Cookie header value"""
+        if not login_session:
+            return None
+        return '; '.join(f"{k}={v}" for k, v in login_session.items())
+
+    def _resolve_usernames(self, config: InstagramScraperInput) -> List[str]:
+        """Determine usernames to scrape (explicit username first, then any URLs)"""
+        usernames = []
+        if config.username:
+            usernames.append(config.username)
+        for url in config.urls or []:
+            username = self._extract_username_from_url(url)
+            if username not in usernames:
+                usernames.append(username)
+        return usernames
+
+    @staticmethod
+    async def _run_batch(coros: Iterable[Awaitable[Any]]) -> List[Any]:
+        """
+        Run coroutines concurrently, preserving input order
+
+        Uses asyncio.TaskGroup on Python 3.11+ and falls back to gather.
+        A failing coroutine does not cancel its siblings; its exception is
+        returned in place of the result.
+        """
+        coros = list(coros)
+
+        if sys.version_info < (3, 11):
+            return await asyncio.gather(*coros, return_exceptions=True)
+
+        results: List[Any] = [None] * len(coros)
+
+        async def _capture(index: int, coro: Awaitable[Any]) -> None:
+            try:
+                results[index] = await coro
+            except Exception as e:
+                results[index] = e
+
+        async with asyncio.TaskGroup() as tg:
+            for index, coro in enumerate(coros):
+                tg.create_task(_capture(index, coro))
+
+        return results
+
+    async def _scrape_target_with_sem(
+        self,
+        username: str,
+        config: InstagramScraperInput
+    ) -> List[Dict[str, Any]]:
+        """Scrape a single target while holding the concurrency semaphore"""
+        async with self._sem:
+            return await self._scrape_target(username, config)
+
+    async def _scrape_target(
+        self,
+        username: str,
+        config: InstagramScraperInput
+    ) -> List[Dict[str, Any]]:
+        """Scrape a single username according to the requested scrape type"""
+        handler = self._dispatch.get(config.scrape_type)
+        if handler is None:
+            logger.warning(f"scrape_type '{config.scrape_type}' is not supported yet - skipping @{username}")
+            return []
+
+        return await handler(username, config)
+
+    async def _scrape_profile_target(
+        self,
+        username: str,
+        config: InstagramScraperInput
+    ) -> List[Dict[str, Any]]:
+        """Scrape profile info only - no post/comment requests are made"""
+        profile = await self._scrape_profile(username)
+        return [profile.model_dump(mode='json')]
+
+    async def _scrape_posts_target(
+        self,
+        username: str,
+        config: InstagramScraperInput
+    ) -> List[Dict[str, Any]]:
+        """Scrape posts (and optionally their comments)"""
+        posts = await self._scrape_posts(
+            username,
+            config.max_posts,
+            filters=config
+        )
+
+        if config.include_comments:
+            # Dump each post as it completes so its comment payload can be released
+            return [
+                post.model_dump(mode='json')
+                async for post in self._scrape_comments_batch(posts, config.max_comments_per_post)
+            ]
+
+        return [post.model_dump(mode='json') for post in posts]
+
     def _extract_username_from_url(self, url: str) -> str:
         """Extract username from Instagram URL"""
-        match = re.search(r'instagram\.com/([^/\?]+)', url)
+        match = _USERNAME_RE.search(url)
         if match:
             return match.group(1)
         return url
 
-    @retry_with_backoff(max_retries=3, base_delay=3.0)
+    @retry_with_backoff(max_retries=3, base_delay=3.0, max_delay=60.0, non_retryable=_NON_RETRYABLE)
     async def _scrape_profile(
         self,
-        username: str,
-        login_session: Optional[Dict[str, str]] = None
+        username: str
     ) -> InstagramProfile:
         """
         Scrape Instagram profile using GraphQL API
 
         Instagram GraphQL endpoint: /api/v1/users/web_profile_info/
         """
-        await self.rate_limit()
-
         url = f"{self.base_url}/api/v1/users/web_profile_info/?username={username}"
 
-        headers = {
-            'x-ig-app-id': '936619743392459',  # Instagram web app ID
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-            'Accept': 'application/json'
-        }
-
-        # Add session cookies if provided
-        if login_session:
-            headers['Cookie'] = '; '.join([f"{k}={v}" for k, v in login_session.items()])
-
         proxy = await self.get_proxy()
 
         # IMPORTANT: Instagram REQUIRES residential proxies with session persistence
         if not proxy:
             logger.warning("No proxy configured - Instagram WILL block requests!")
 
-        # StealthyFetcher is synchronous, not async
-            try:
-                fetcher = StealthyFetcher(proxy=proxy, headers=headers)
-                response = fetcher.get(url)
-
-                if response.status == 429:
-                    raise Exception("Rate limited by Instagram - need to wait")
-
-                if response.status == 401:
-                    raise Exception("Unauthorized - login session required")
-
-                data = json.loads(response.text)
-
-                user_data = data.get('data', {}).get('user', {})
-
-                profile = InstagramProfile(
-                    username=user_data.get('username', username),
-                    full_name=user_data.get('full_name', ''),
-                    biography=user_data.get('biography', ''),
-                    external_url=user_data.get('external_url'),
-                    follower_count=user_data.get('edge_followed_by', {}).get('count', 0),
-                    following_count=user_data.get('edge_follow', {}).get('count', 0),
-                    post_count=user_data.get('edge_owner_to_timeline_media', {}).get('count', 0),
-                    is_verified=user_data.get('is_verified', False),
-                    is_private=user_data.get('is_private', False),
-                    is_business=user_data.get('is_business_account', False),
-                    category=user_data.get('category_name'),
-                    profile_pic_url=user_data.get('profile_pic_url', ''),
-                    profile_pic_url_hd=user_data.get('profile_pic_url_hd')
-                )
-
-                if proxy and self.proxy_manager:
-                    self.proxy_manager.report_success(proxy)
-
-                return profile
-
-            except Exception as e:
-                if proxy and self.proxy_manager:
-                    self.proxy_manager.report_failure(proxy)
-                raise
+        data = await self._request_json(url, proxy)
+
+        user_data = data.get('data', _EMPTY).get('user', _EMPTY)
+
+        return InstagramProfile(
+            username=user_data.get('username', username),
+            full_name=user_data.get('full_name', ''),
+            biography=user_data.get('biography', ''),
+            external_url=user_data.get('external_url'),
+            follower_count=user_data.get('edge_followed_by', _EMPTY).get('count', 0),
+            following_count=user_data.get('edge_follow', _EMPTY).get('count', 0),
+            post_count=user_data.get('edge_owner_to_timeline_media', _EMPTY).get('count', 0),
+            is_verified=user_data.get('is_verified', False),
+            is_private=user_data.get('is_private', False),
+            is_business=user_data.get('is_business_account', False),
+            category=user_data.get('category_name'),
+            profile_pic_url=user_data.get('profile_pic_url', ''),
+            profile_pic_url_hd=user_data.get('profile_pic_url_hd')
+        )
 
     async def _scrape_posts(
         self,
         username: str,
         max_posts: int,
-        login_session: Optional[Dict[str, str]] = None
+        filters: Optional[InstagramScraperInput] = None
     ) -> List[InstagramPost]:
         """
         Scrape posts from Instagram profile
 
-        Uses GraphQL API when possible, browser automation as fallback
+        Uses GraphQL API when possible, browser automation as fallback.
+        If ``filters`` is given, only posts within its date range are kept.
         """
         posts = []
 
         # Try GraphQL approach first
         try:
-            posts = await self._scrape_posts_graphql(username, max_posts, login_session)
+            posts = await self._scrape_posts_graphql(username, max_posts, filters)
         except Exception as e:
             logger.warning(f"GraphQL approach failed: {e}")
             logger.info("Falling back to browser automation...")
 
             # Fallback to browser automation
             try:
-                posts = await self._scrape_posts_browser(username, max_posts, login_session)
+                posts = await self._scrape_posts_browser(username, max_posts, filters)
             except Exception as e2:
                 logger.error(f"Browser automation also failed: {e2}")
 
         return posts
 
+    @retry_with_backoff(max_retries=3, base_delay=3.0, max_delay=60.0, non_retryable=_NON_RETRYABLE)
     async def _scrape_posts_graphql(
         self,
         username: str,
         max_posts: int,
-        login_session: Optional[Dict[str, str]] = None
+        filters: Optional[InstagramScraperInput] = None
     ) -> List[InstagramPost]:
-        """Scrape posts using GraphQL API"""
-        await self.rate_limit()
+        """
+        Scrape posts using GraphQL API
 
+        The profile endpoint returns the first batch of posts; further pages
+        are fetched in the same loop with the same proxy.
+        """
         # Instagram GraphQL endpoint for user media
         url = f"{self.base_url}/{username}/?__a=1&__d=dis"
 
-        headers = {
-            'x-ig-app-id': '936619743392459',
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-            'Accept': 'application/json',
-            'X-Requested-With': 'XMLHttpRequest'
-        }
-
-        if login_session:
-            headers['Cookie'] = '; '.join([f"{k}={v}" for k, v in login_session.items()])
-
         proxy = await self.get_proxy()
-        posts = []
 
-        # StealthyFetcher is synchronous, not async
-            try:
-                fetcher = StealthyFetcher(proxy=proxy, headers=headers)
-                response = fetcher.get(url)
+        data = await self._request_json(url, proxy, self._BASE_HEADERS_XHR)
 
-                if response.status != 200:
-                    raise Exception(f"Failed to fetch profile data: {response.status}")
+        # Extract user data
+        user_data = data.get('graphql', _EMPTY).get('user', _EMPTY) or \
+                   data.get('data', _EMPTY).get('user', _EMPTY)
 
-                data = json.loads(response.text)
+        if not user_data:
+            logger.warning("Could not extract user data from response")
+            return []
 
-                # Extract user data
-                user_data = data.get('graphql', {}).get('user', {}) or \
-                           data.get('data', {}).get('user', {})
+        # Get media edges
+        media = user_data.get('edge_owner_to_timeline_media', _EMPTY)
+        media_edges = media.get('edges', ())
 
-                if not user_data:
-                    logger.warning("Could not extract user data from response")
-                    return posts
+        logger.info(f"Found {len(media_edges)} posts in GraphQL response")
 
-                # Get media edges
-                media_edges = user_data.get('edge_owner_to_timeline_media', {}).get('edges', [])
+        first_edges = list(islice(media_edges, max_posts))
+        posts = self._parse_post_edges(first_edges, filters)
 
-                logger.info(f"Found {len(media_edges)} posts in GraphQL response")
+        # If we need more posts, paginate using end cursor
+        user_id = user_data.get('id')
+        page_info = media.get('page_info', _EMPTY)
+        reached_date_from = self._edges_reach_date_from(first_edges, filters)
 
-                for edge in media_edges[:max_posts]:
-                    try:
-                        node = edge.get('node', {})
-                        post = self._parse_post_from_graphql(node, username)
-                        if post:
-                            posts.append(post)
-                    except Exception as e:
-                        logger.debug(f"Error parsing post: {e}")
-                        continue
+        while len(posts) < max_posts and page_info.get('has_next_page') and not reached_date_from:
+            variables = {
+                "id": user_id,
+                "first": min(max_posts - len(posts), 50),
+                "after": page_info.get('end_cursor')
+            }
 
-                # If we need more posts, paginate using end cursor
-                if len(posts) < max_posts:
-                    page_info = user_data.get('edge_owner_to_timeline_media', {}).get('page_info', {})
-                    if page_info.get('has_next_page'):
-                        end_cursor = page_info.get('end_cursor')
-                        more_posts = await self._fetch_paginated_posts(
-                            user_data.get('id'),
-                            end_cursor,
-                            max_posts - len(posts),
-                            login_session
-                        )
-                        posts.extend(more_posts)
+            try:
+                data = await self._fetch_graphql_page(self._POSTS_QUERY_HASH, variables, proxy)
+            except Exception as e:
+                # Keep the pages already collected rather than failing the whole target
+                logger.warning(f"Pagination failed: {e}")
+                break
 
-                if proxy and self.proxy_manager:
-                    self.proxy_manager.report_success(proxy)
+            media = data.get('data', _EMPTY).get('user', _EMPTY).get('edge_owner_to_timeline_media', _EMPTY)
+            edges = media.get('edges', ())
+            if not edges:
+                break
 
-                logger.info(f"Successfully scraped {len(posts)} posts via GraphQL")
+            posts.extend(self._parse_post_edges(edges, filters))
+            page_info = media.get('page_info', _EMPTY)
+            reached_date_from = self._edges_reach_date_from(edges, filters)
 
-            except Exception as e:
-                if proxy and self.proxy_manager:
-                    self.proxy_manager.report_failure(proxy)
-                raise
+        logger.info(f"Successfully scraped {len(posts)} posts via GraphQL")
 
         return posts
 
-    async def _fetch_paginated_posts(
+    @retry_with_backoff(max_retries=3, base_delay=3.0, max_delay=60.0, non_retryable=_NON_RETRYABLE)
+    async def _fetch_graphql_page(
         self,
-        user_id: str,
-        end_cursor: str,
-        max_posts: int,
-        login_session: Optional[Dict[str, str]] = None
-    ) -> List[InstagramPost]:
-        """Fetch paginated posts using GraphQL"""
-        await self.rate_limit()
-
-        # GraphQL query hash for user media (changes periodically)
-        query_hash = "69cba40317214236af40e7efa697781d"  # May need updating
-
-        variables = {
-            "id": user_id,
-            "first": min(max_posts, 50),
-            "after": end_cursor
-        }
-
-        url = f"{self.base_url}/graphql/query/?query_hash={query_hash}&variables={json.dumps(variables)}"
+        query_hash: str,
+        variables: Dict[str, Any],
+        proxy: Optional[str | Dict[str, str]] = None
+    ) -> Any:
+        """Fetch and parse one page of a GraphQL query, retrying on failure"""
+        url = f"{self.base_url}/graphql/query/?query_hash={query_hash}&variables={_dumps(variables)}"
+        return await self._request_json(url, proxy)
+
+    async def _request_json(
+        self,
+        url: str,
+        proxy: Optional[str | Dict[str, str]] = None,
+        base_headers: Optional[Mapping[str, str]] = None
+    ) -> Any:
+        """
+        GET an Instagram API URL and return the parsed JSON body
 
-        headers = {
-            'x-ig-app-id': '936619743392459',
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-            'Accept': 'application/json'
-        }
+        Adds the session cookie, raises the typed error for non-200
+        responses, and reports the outcome of the proxy to the proxy manager.
+        Only bodies that parse are cached, so a login-wall page or truncated
+        response is refetched on retry instead of being served again.
+        """
+        headers = self._headers(base_headers or self._BASE_HEADERS_JSON)
 
-        if login_session:
-            headers['Cookie'] = '; '.join([f"{k}={v}" for k, v in login_session.items()])
+        try:
+            status, body, from_cache = await self._fetch(url, headers, proxy)
+            _check(status)
+            data = _parse_response(body)
+        except Exception:
+            if proxy and self.proxy_manager:
+                self.proxy_manager.report_failure(proxy)
+            raise
+
+        if not from_cache:
+            await self._store_response(url, headers, body)
+
+        if proxy and self.proxy_manager:
+            self.proxy_manager.report_success(proxy)
+
+        return data
+
+    @staticmethod
+    def _edges_reach_date_from(
+        edges: List[Dict[str, Any]],
+        filters: Optional[InstagramScraperInput] = None
+    ) -> bool:
+        """
+        Check whether a page of media edges has gone past the date_from bound
 
-        proxy = await self.get_proxy()
-        posts = []
+        The feed is newest first, so once the last post of a page is older than
+        date_from, later pages can't hold anything in range. The last edge is
+        used rather than the page minimum so an old pinned post at the top of
+        the first page doesn't end pagination early.
+        """
+        if not filters or not edges:
+            return False
+        return filters.timestamp_before_range(edges[-1].get('node', _EMPTY).get('taken_at_timestamp', 0))
 
-        # StealthyFetcher is synchronous, not async
+    def _parse_post_edges(
+        self,
+        edges: Iterable[Dict[str, Any]],
+        filters: Optional[InstagramScraperInput] = None
+    ) -> List[InstagramPost]:
+        """Parse and validate GraphQL media edges, dropping posts outside the date range"""
+        raw_posts = []
+        for edge in edges:
             try:
-                fetcher = StealthyFetcher(proxy=proxy, headers=headers)
-                response = fetcher.get(url)
-                data = json.loads(response.text)
-
-                edges = data.get('data', {}).get('user', {}).get('edge_owner_to_timeline_media', {}).get('edges', [])
-
-                for edge in edges:
-                    try:
-                        node = edge.get('node', {})
-                        post = self._parse_post_from_graphql(node, '')
-                        if post:
-                            posts.append(post)
-                    except Exception as e:
-                        logger.debug(f"Error parsing paginated post: {e}")
-                        continue
-
+                node = edge.get('node', _EMPTY)
+                if filters and not filters.timestamp_in_range(node.get('taken_at_timestamp', 0)):
+                    continue
+                raw_post = self._parse_post_from_graphql(node)
+                if raw_post:
+                    raw_posts.append(raw_post)
             except Exception as e:
-                logger.warning(f"Pagination failed: {e}")
+                logger.debug(f"Error parsing post: {e}")
+                continue
 
-        return posts
+        return self._validate_posts(raw_posts)
 
-    def _parse_post_from_graphql(self, node: Dict[str, Any], username: str) -> Optional[InstagramPost]:
-        """Parse post from GraphQL node data"""
+    def _validate_posts(self, raw_posts: List[Dict[str, Any]]) -> List[InstagramPost]:
+        """
+        Validate raw post dicts in one pass
+
+        Falls back to per-item validation so a single malformed post
+        doesn't discard the whole batch.
+        """
+        try:
+            return POSTS_ADAPTER.validate_python(raw_posts)
+        except ValidationError:
+            posts = []
+            for raw_post in raw_posts:
+                try:
+                    posts.append(InstagramPost.model_validate(raw_post))
+                except ValidationError as e:
+                    logger.debug(f"Invalid post {raw_post.get('shortcode')}: {e}")
+            return posts
+
+    def _validate_comments(self, raw_comments: List[Dict[str, Any]]) -> List[InstagramComment]:
+        """Validate raw comment dicts in one pass (per-item on failure)"""
+        try:
+            return COMMENTS_ADAPTER.validate_python(raw_comments)
+        except ValidationError:
+            comments = []
+            for raw_comment in raw_comments:
+                try:
+                    comments.append(COMMENT_ADAPTER.validate_python(raw_comment))
+                except ValidationError as e:
+                    logger.debug(f"Invalid comment {raw_comment.get('comment_id')}: {e}")
+            return comments
+
+    def _parse_post_from_graphql(self, node: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Parse post fields from GraphQL node data (validated in bulk later)"""
         try:
             shortcode = node.get('shortcode', '')
             if not shortcode:
@@ -346,9 +770,9 @@ class InstagramScraper(BaseActor):
 
             # Extract caption
             caption = ''
-            caption_edges = node.get('edge_media_to_caption', {}).get('edges', [])
+            caption_edges = node.get('edge_media_to_caption', _EMPTY).get('edges', ())
             if caption_edges:
-                caption = caption_edges[0].get('node', {}).get('text', '')
+                caption = caption_edges[0].get('node', _EMPTY).get('text', '')
 
             # Extract media type
             typename = node.get('__typename', '')
@@ -361,9 +785,9 @@ class InstagramScraper(BaseActor):
             # Extract media URLs
             media_urls = []
             if media_type == 'carousel':
-                sidecar_edges = node.get('edge_sidecar_to_children', {}).get('edges', [])
+                sidecar_edges = node.get('edge_sidecar_to_children', _EMPTY).get('edges', ())
                 for edge in sidecar_edges:
-                    child_node = edge.get('node', {})
+                    child_node = edge.get('node', _EMPTY)
                     media_url = child_node.get('display_url') or child_node.get('video_url', '')
                     if media_url:
                         media_urls.append(media_url)
@@ -373,26 +797,24 @@ class InstagramScraper(BaseActor):
                     media_urls.append(media_url)
 
             # Extract engagement metrics
-            likes = node.get('edge_media_preview_like', {}).get('count') or \
-                   node.get('edge_liked_by', {}).get('count', 0)
-            comments_count = node.get('edge_media_to_comment', {}).get('count', 0)
-
-            # Create post object
-            post = InstagramPost(
-                shortcode=shortcode,
-                post_url=f"{self.base_url}/p/{shortcode}/",
-                media_type=media_type,
-                media_urls=media_urls,
-                caption=caption,
-                likes=likes,
-                comments_count=comments_count,
-                timestamp=datetime.fromtimestamp(node.get('taken_at_timestamp', 0)),
-                is_video=node.get('is_video', False),
-                video_views=node.get('video_view_count', 0) if node.get('is_video') else 0,
-                owner_username=node.get('owner', {}).get('username', username)
-            )
-
-            return post
+            likes = node.get('edge_media_preview_like', _EMPTY).get('count') or \
+                   node.get('edge_liked_by', _EMPTY).get('count', 0)
+            comments_count = node.get('edge_media_to_comment', _EMPTY).get('count', 0)
+
+            hashtags, mentions = _extract_caption_tags(caption)
+
+            return {
+                'shortcode': shortcode,
+                'type': media_type,
+                'media_urls': media_urls,
+                'caption': caption,
+                'hashtags': hashtags,
+                'mentions': mentions,
+                'likes': likes,
+                'comments_count': comments_count,
+                'timestamp': _ts_to_dt(node.get('taken_at_timestamp', 0)),
+                'video_views': node.get('video_view_count', 0) if node.get('is_video') else None
+            }
 
         except Exception as e:
             logger.debug(f"Error parsing post from GraphQL: {e}")
@@ -402,14 +824,14 @@ class InstagramScraper(BaseActor):
         self,
         username: str,
         max_posts: int,
-        login_session: Optional[Dict[str, str]] = None
+        filters: Optional[InstagramScraperInput] = None
     ) -> List[InstagramPost]:
         """
         Scrape posts using browser automation (fallback)
 
         Uses Playwright through DynamicFetcher
         """
-        posts = []
+        raw_posts = []
         proxy = await self.get_proxy()
 
         async with DynamicFetcher(
@@ -423,112 +845,129 @@ class InstagramScraper(BaseActor):
                 # Wait for posts to load
                 await fetcher.wait_for_selector('article', timeout=10000)
 
-                # Scroll to load more posts
+                # Scroll to load more posts, waiting on the rendered link count
+                # rather than a fixed delay; stop early once a scroll adds nothing
                 scrolls_needed = (max_posts // 12) + 1  # Instagram loads ~12 posts at a time
-                for i in range(scrolls_needed):
+                prev_count = -1
+                for _ in range(scrolls_needed):
                     await fetcher.evaluate('window.scrollTo(0, document.body.scrollHeight)')
-                    await asyncio.sleep(2)  # Human-like delay
+                    try:
+                        await fetcher.wait_for_function(f"{_POST_LINK_COUNT_JS} >= {max_posts}", timeout=4000)
+                        break
+                    except BrowserTimeoutError:  # Enough links haven't rendered yet
+                        count = await fetcher.evaluate(_POST_LINK_COUNT_JS)
+                        if count == prev_count:
+                            break
+                        prev_count = count
 
                 # Extract post links from the page
                 page = fetcher.get_page()
-                post_link_elements = page.css('article a[href*="/p/"]').getall()
+                post_link_elements = page.css(_POST_LINK_SELECTOR).getall()
 
-                # Extract shortcodes from links
+                # Extract unique shortcodes from links, keeping page order
+                # (each post is usually linked more than once)
+                seen = set()
                 shortcodes = []
                 for link_html in post_link_elements:
-                    match = re.search(r'/p/([^/\?]+)', link_html)
+                    match = _SHORTCODE_RE.search(link_html)
                     if match:
                         shortcode = match.group(1)
-                        if shortcode not in shortcodes:
+                        if shortcode not in seen:
+                            seen.add(shortcode)
                             shortcodes.append(shortcode)
 
                 logger.info(f"Found {len(shortcodes)} unique posts")
 
                 # Visit each post to extract detailed data
-                for shortcode in shortcodes[:max_posts]:
+                for shortcode in islice(shortcodes, max_posts):
                     try:
                         await self.rate_limit()  # Respect rate limits
                         post_url = f"{self.base_url}/p/{shortcode}/"
 
                         await fetcher.goto(post_url)
-                        await asyncio.sleep(2)  # Wait for load
+                        try:
+                            await fetcher.wait_for_selector('article', timeout=10000)
+                        except BrowserTimeoutError:
+                            # Still try to parse whatever did load (meta tags, sharedData)
+                            logger.debug(f"Post {shortcode} did not render an article in time")
 
                         # Extract page HTML
                         page = fetcher.get_page()
                         page_html = page.text if hasattr(page, 'text') else str(page)
 
                         # Try to extract data from embedded JSON
-                        json_match = re.search(r'window\._sharedData\s*=\s*({.*?});', page_html, re.DOTALL)
+                        json_match = _SHARED_DATA_RE.search(page_html)
                         if json_match:
                             try:
-                                shared_data = json.loads(json_match.group(1))
-                                post_data = shared_data.get('entry_data', {}).get('PostPage', [{}])[0]
-                                post_media = post_data.get('graphql', {}).get('shortcode_media', {})
+                                shared_data = _loads(json_match.group(1))
+                                post_data = shared_data.get('entry_data', _EMPTY).get('PostPage', (_EMPTY,))[0]
+                                post_media = post_data.get('graphql', _EMPTY).get('shortcode_media', _EMPTY)
 
                                 if post_media:
-                                    post = self._parse_post_from_graphql(post_media, username)
-                                    if post:
-                                        posts.append(post)
+                                    if filters and not filters.timestamp_in_range(
+                                        post_media.get('taken_at_timestamp', 0)
+                                    ):
+                                        continue
+                                    raw_post = self._parse_post_from_graphql(post_media)
+                                    if raw_post:
+                                        raw_posts.append(raw_post)
                                         continue
 
                             except Exception as e:
                                 logger.debug(f"Could not extract from shared data: {e}")
 
                         # Fallback: Parse from HTML
-                        post = self._parse_post_from_browser_html(page_html, shortcode, username)
-                        if post:
-                            posts.append(post)
+                        raw_post = self._parse_post_from_browser_html(page_html, shortcode)
+                        if raw_post:
+                            raw_posts.append(raw_post)
 
                     except Exception as e:
                         logger.warning(f"Error extracting post {shortcode}: {e}")
                         continue
 
-                logger.info(f"Successfully scraped {len(posts)} posts via browser")
+                logger.info(f"Successfully scraped {len(raw_posts)} posts via browser")
 
             except Exception as e:
                 logger.error(f"Browser scraping failed: {e}")
 
-        return posts
+        return self._validate_posts(raw_posts)
 
-    def _parse_post_from_browser_html(self, html: str, shortcode: str, username: str) -> Optional[InstagramPost]:
-        """Parse post from browser HTML as fallback"""
+    def _parse_post_from_browser_html(self, html: str, shortcode: str) -> Optional[Dict[str, Any]]:
+        """Parse post fields from browser HTML as fallback"""
         try:
-            # Extract caption
-            caption_match = re.search(r'<meta property="og:description" content="([^"]*)"', html)
-            caption = caption_match.group(1) if caption_match else ''
-
-            # Extract media URL
-            media_match = re.search(r'<meta property="og:image" content="([^"]*)"', html)
-            media_url = media_match.group(1) if media_match else ''
-
-            # Extract video URL if present
-            video_match = re.search(r'<meta property="og:video" content="([^"]*)"', html)
-            is_video = bool(video_match)
-            if is_video:
-                media_url = video_match.group(1)
-
-            # Extract likes (approximate from HTML)
-            likes_match = re.search(r'(\d+(?:,\d+)*)\s*(?:like|likes)', html, re.I)
-            likes = int(likes_match.group(1).replace(',', '')) if likes_match else 0
-
-            # Extract comments count
-            comments_match = re.search(r'(\d+(?:,\d+)*)\s*(?:comment|comments)', html, re.I)
-            comments_count = int(comments_match.group(1).replace(',', '')) if comments_match else 0
-
-            post = InstagramPost(
-                shortcode=shortcode,
-                post_url=f"{self.base_url}/p/{shortcode}/",
-                media_type='video' if is_video else 'image',
-                media_urls=[media_url] if media_url else [],
-                caption=caption,
-                likes=likes,
-                comments_count=comments_count,
-                timestamp=datetime.now(),  # Can't extract without GraphQL
-                is_video=is_video,
-                owner_username=username
-            )
-
-            return post
+            # Extract caption and media URL (the video URL wins when present)
+            meta = {}
+            for match in _OG_META_RE.finditer(html):
+                meta.setdefault(match['prop'], match['value'])
+
+            caption = meta.get('description', '')
+            is_video = 'video' in meta
+            media_url = meta.get('video') or meta.get('image', '')
+
+            # Extract likes and comments count (approximate from HTML) -
+            # the first occurrence of each kind wins
+            counts = {}
+            for match in _COUNTS_RE.finditer(html):
+                counts.setdefault(match['kind'].lower(), int(match['count'].replace(',', '')))
+                if len(counts) == 2:
+                    break
+
+            likes = counts.get('like', 0)
+            comments_count = counts.get('comment', 0)
+
+            hashtags, mentions = _extract_caption_tags(caption)
+
+            return {
+                'shortcode': shortcode,
+                'type': 'video' if is_video else 'image',
+                'media_urls': [media_url] if media_url else [],
+                'caption': caption,
+                'hashtags': hashtags,
+                'mentions': mentions,
+                'likes': likes,
+                'comments_count': comments_count,
+                'timestamp': datetime.now(_UTC)  # Can't extract without GraphQL
+            }
 
         except Exception as e:
             logger.debug(f"Error parsing post from browser HTML: {e}")
@@ -538,165 +977,104 @@ class InstagramScraper(BaseActor):
         self,
         posts: List[InstagramPost],
         max_comments: int
-    ) -> List[InstagramPost]:
-        """Scrape comments for multiple posts"""
+    ) -> AsyncIterator[InstagramPost]:
+        """Scrape comments for multiple posts, yielding each post as it completes"""
         logger.info(f"Scraping comments for {len(posts)} posts...")
 
-        # Scrape comments in parallel (with concurrency limit)
-        tasks = []
-        for post in posts:
-            task = self._scrape_post_comments(post, max_comments)
-            tasks.append(task)
+        # Keep 3 comment requests in flight at all times to avoid rate limits;
+        # a slot frees up as soon as any post finishes
+        sem = asyncio.Semaphore(3)
+
+        async def _guarded(post: InstagramPost) -> InstagramPost:
+            async with sem:
+                try:
+                    return await self._scrape_post_comments(post, max_comments)
+                except Exception as e:
+                    # Retries exhausted - keep the post, just without comments
+                    logger.error(f"Error scraping comments for post {post.shortcode}: {e}")
+                    return post
 
-        # Run 3 at a time to avoid rate limits
-        results = []
-        for i in range(0, len(tasks), 3):
-            batch = tasks[i:i+3]
-            batch_results = await asyncio.gather(*batch, return_exceptions=True)
-            results.extend(batch_results)
-
-        # Filter out errors
-        posts_with_comments = []
-        for result in results:
-            if isinstance(result, Exception):
-                logger.error(f"Error scraping comments: {result}")
-            elif result:
-                posts_with_comments.append(result)
+        tasks = [asyncio.ensure_future(_guarded(post)) for post in posts]
 
-        return posts_with_comments
+        try:
+            # _guarded never raises, so every task resolves to a post
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # Consumer stopped early (or failed) - don't leave requests running
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
 
     async def _scrape_post_comments(
         self,
         post: InstagramPost,
         max_comments: int
     ) -> InstagramPost:
-        """Scrape comments for a single post using GraphQL"""
-        await self.rate_limit()
+        """
+        Scrape comments for a single post using GraphQL
 
+        All pages go through one loop that reuses the proxy; each page
+        request is retried by _fetch_graphql_page.
+        """
         logger.info(f"Scraping comments for post: {post.shortcode}")
 
-        # GraphQL query hash for comments (changes periodically)
-        query_hash = "bc3296d1ce80a24b1b6e40b1e72903f5"  # May need updating
-
         variables = {
             "shortcode": post.shortcode,
             "first": min(max_comments, 50)
         }
 
-        url = f"{self.base_url}/graphql/query/?query_hash={query_hash}&variables={json.dumps(variables)}"
-
-        headers = {
-            'x-ig-app-id': '936619743392459',
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-            'Accept': 'application/json'
-        }
-
         proxy = await self.get_proxy()
         comments = []
 
-        # StealthyFetcher is synchronous, not async
+        while True:
             try:
-                fetcher = StealthyFetcher(proxy=proxy, headers=headers)
-                response = fetcher.get(url)
-
-                if response.status != 200:
-                    logger.warning(f"Failed to fetch comments: {response.status}")
-                    return post
-
-                data = json.loads(response.text)
-
-                # Extract comment edges
-                media_data = data.get('data', {}).get('shortcode_media', {})
-                comment_edges = media_data.get('edge_media_to_parent_comment', {}).get('edges', [])
-
-                for edge in comment_edges:
-                    try:
-                        node = edge.get('node', {})
-                        comment = self._parse_comment_from_graphql(node)
-                        if comment:
-                            comments.append(comment)
-                    except Exception as e:
-                        logger.debug(f"Error parsing comment: {e}")
-                        continue
-
-                # Handle pagination if we need more comments
-                if len(comments) < max_comments:
-                    page_info = media_data.get('edge_media_to_parent_comment', {}).get('page_info', {})
-                    if page_info.get('has_next_page'):
-                        end_cursor = page_info.get('end_cursor')
-                        more_comments = await self._fetch_paginated_comments(
-                            post.shortcode,
-                            end_cursor,
-                            max_comments - len(comments)
-                        )
-                        comments.extend(more_comments)
-
-                post.comments = comments
-                logger.info(f"Scraped {len(comments)} comments for post {post.shortcode}")
-
-                if proxy and self.proxy_manager:
-                    self.proxy_manager.report_success(proxy)
-
+                data = await self._fetch_graphql_page(self._COMMENTS_QUERY_HASH, variables, proxy)
             except Exception as e:
-                logger.error(f"Error scraping comments for post {post.shortcode}: {e}")
-                if proxy and self.proxy_manager:
-                    self.proxy_manager.report_failure(proxy)
-
-        return post
-
-    async def _fetch_paginated_comments(
-        self,
-        shortcode: str,
-        end_cursor: str,
-        max_comments: int
-    ) -> List[InstagramComment]:
-        """Fetch paginated comments using GraphQL"""
-        await self.rate_limit()
+                if 'after' not in variables:
+                    raise
+                # Keep the comments already collected
+                logger.warning(f"Comment pagination failed: {e}")
+                break
 
-        query_hash = "bc3296d1ce80a24b1b6e40b1e72903f5"  # May need updating
+            # Extract comment edges
+            comment_data = data.get('data', _EMPTY).get('shortcode_media', _EMPTY).get('edge_media_to_parent_comment', _EMPTY)
+            edges = comment_data.get('edges', ())
+            comments.extend(self._parse_comment_edges(edges))
 
-        variables = {
-            "shortcode": shortcode,
-            "first": min(max_comments, 50),
-            "after": end_cursor
-        }
+            # Handle pagination if we need more comments
+            page_info = comment_data.get('page_info', _EMPTY)
+            if not edges or len(comments) >= max_comments or not page_info.get('has_next_page'):
+                break
 
-        url = f"{self.base_url}/graphql/query/?query_hash={query_hash}&variables={json.dumps(variables)}"
+            variables = {
+                "shortcode": post.shortcode,
+                "first": min(max_comments - len(comments), 50),
+                "after": page_info.get('end_cursor')
+            }
 
-        headers = {
-            'x-ig-app-id': '936619743392459',
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-            'Accept': 'application/json'
-        }
+        logger.info(f"Scraped {len(comments)} comments for post {post.shortcode}")
 
-        proxy = await self.get_proxy()
-        comments = []
+        # Posts are frozen; attach comments on a copy
+        return post.model_copy(update={'comments': comments})
 
-        # StealthyFetcher is synchronous, not async
+    def _parse_comment_edges(self, edges: Iterable[Dict[str, Any]]) -> List[InstagramComment]:
+        """Parse and validate GraphQL comment edges"""
+        raw_comments = []
+        for edge in edges:
             try:
-                fetcher = StealthyFetcher(proxy=proxy, headers=headers)
-                response = fetcher.get(url)
-                data = json.loads(response.text)
-
-                edges = data.get('data', {}).get('shortcode_media', {}).get('edge_media_to_parent_comment', {}).get('edges', [])
-
-                for edge in edges:
-                    try:
-                        node = edge.get('node', {})
-                        comment = self._parse_comment_from_graphql(node)
-                        if comment:
-                            comments.append(comment)
-                    except Exception as e:
-                        logger.debug(f"Error parsing paginated comment: {e}")
-                        continue
-
+                node = edge.get('node', _EMPTY)
+                raw_comment = self._parse_comment_from_graphql(node)
+                if raw_comment:
+                    raw_comments.append(raw_comment)
             except Exception as e:
-                logger.warning(f"Comment pagination failed: {e}")
+                logger.debug(f"Error parsing comment: {e}")
+                continue
 
-        return comments
+        return self._validate_comments(raw_comments)
 
-    def _parse_comment_from_graphql(self, node: Dict[str, Any]) -> Optional[InstagramComment]:
-        """Parse comment from GraphQL node data"""
+    def _parse_comment_from_graphql(self, node: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Parse comment fields from GraphQL node data (validated in bulk later)"""
         try:
             comment_id = node.get('id', '')
             if not comment_id:
@@ -706,24 +1084,20 @@ class InstagramScraper(BaseActor):
             text = node.get('text', '')
 
             # Extract author info
-            owner = node.get('owner', {})
+            owner = node.get('owner', _EMPTY)
             author_username = owner.get('username', '')
 
             # Extract likes
-            likes = node.get('edge_liked_by', {}).get('count', 0)
-
-            # Extract timestamp
-            timestamp = datetime.fromtimestamp(node.get('created_at', 0))
-
-            comment = InstagramComment(
-                comment_id=comment_id,
-                text=text,
-                author_username=author_username,
-                likes=likes,
-                timestamp=timestamp
-            )
-
-            return comment
+            likes = node.get('edge_liked_by', _EMPTY).get('count', 0)
+
+            return {
+                'comment_id': comment_id,
+                'text': text,
+                'author_username': author_username,
+                'author_verified': owner.get('is_verified', False),
+                'likes': likes,
+                'timestamp': _ts_to_dt(node.get('created_at', 0))
+            }
 
         except Exception as e:
             logger.debug(f"Error parsing comment from GraphQL: {e}")
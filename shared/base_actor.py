@@ -5,7 +5,7 @@ Base Actor - Abstract base class for all actors
 import asyncio
 import logging
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 from pathlib import Path
 
 from .utils import (
@@ -100,6 +100,22 @@ class BaseActor(ABC):
         """
         pass
 
+    async def iter_scrape(self, input_data: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield scraped records one at a time
+
+        Default implementation wraps scrape(); override to yield records as
+        soon as they are available so run_stream() never buffers them all.
+
+        Args:
+            input_data: Input parameters for scraping
+
+        Yields:
+            Scraped data dictionaries
+        """
+        for item in await self.scrape(input_data):
+            yield item
+
     @abstractmethod
     def validate_input(self, input_data: Dict[str, Any]) -> bool:
         """
@@ -157,6 +173,54 @@ class BaseActor(ABC):
             logger.error(f"Error running actor: {e}", exc_info=True)
             raise
 
+    async def run_stream(
+        self,
+        input_data: Dict[str, Any],
+        filename: Optional[str] = None
+    ) -> Path:
+        """
+        Run the actor, streaming results straight to a JSON Lines file
+
+        Records are written as they are scraped instead of being collected
+        in self.results first, keeping memory flat on large runs.
+
+        Args:
+            input_data: Input parameters
+            filename: Base filename (default: actor name)
+
+        Returns:
+            Path of the written .jsonl file
+        """
+        try:
+            # Validate input
+            logger.info("Validating input...")
+            self.validate_input(input_data)
+
+            if filename is None:
+                filename = self.__class__.__name__.lower()
+
+            filepath = self.output_dir / f"{filename}.jsonl"
+
+            # Run scraping
+            logger.info("Starting streaming scrape...")
+            start_time = asyncio.get_event_loop().time()
+
+            count = await self.exporter.stream_jsonl(self.iter_scrape(input_data), filepath)
+
+            end_time = asyncio.get_event_loop().time()
+            duration = end_time - start_time
+
+            logger.info(
+                f"Scraping completed. "
+                f"Results: {count} items streamed to {filepath} in {duration:.2f}s"
+            )
+
+            return filepath
+
+        except Exception as e:
+            logger.error(f"Error running actor: {e}", exc_info=True)
+            raise
+
     async def export_results(
         self,
         formats: List[str] = ['json', 'csv'],
@@ -238,3 +302,9 @@ class BaseActor(ABC):
     async def cleanup(self) -> None:
         """Cleanup resources (override if needed)"""
         logger.info("Cleaning up...")
+
+    async def __aenter__(self) -> "BaseActor":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.cleanup()
@@ -5,13 +5,9 @@ Supports IPRoyal residential proxies and manual proxy configuration
 
 import os
 import sys
-from pathlib import Path
 from typing import Dict, Any, Optional
 from dotenv import load_dotenv
 
-# Add parent to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 # Load environment variables
 load_dotenv()
 
@@ -115,5 +111,7 @@ def load_actor_config(
         'rate_limit': get_rate_limit_config(default_rate_limit, default_rate_window),
         'cache': get_cache_config(actor_name),
         'output_dir': os.getenv('OUTPUT_DIR', f'output/{actor_name}'),
-        'log_level': os.getenv('LOG_LEVEL', 'INFO')
+        'log_level': os.getenv('LOG_LEVEL', 'INFO'),
+        # uvloop is not available on Windows
+        'use_uvloop': os.getenv('USE_UVLOOP', 'true').lower() == 'true' and sys.platform != 'win32'
     }
@@ -6,7 +6,7 @@ from .proxy_manager import ProxyManager
 from .rate_limiter import RateLimiter, MultiRateLimiter
 from .error_handler import retry_with_backoff, CircuitBreaker
 from .data_exporter import DataExporter
-from .cache_manager import CacheManager, RedisCacheManager
+from .cache_manager import CacheManager, RedisCacheManager, MemoryCache
 
 __all__ = [
     'ProxyManager',
@@ -17,4 +17,5 @@ __all__ = [
     'DataExporter',
     'CacheManager',
     'RedisCacheManager',
+    'MemoryCache',
 ]
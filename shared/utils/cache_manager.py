@@ -5,13 +5,74 @@ Cache Manager - Cache scraped data to reduce duplicate requests
 import json
 import hashlib
 import logging
-from typing import Any, Optional
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
 from pathlib import Path
 import time
 
 logger = logging.getLogger(__name__)
 
 
+class MemoryCache:
+    """
+    Small in-process LRU cache with a per-entry TTL
+
+    Meant as a hot tier in front of CacheManager for keys that are re-read
+    within one run; evicts the least recently used entry past maxsize.
+
+    Example:
+        cache = MemoryCache(maxsize=512, ttl=300)  # 5 minute cache
+
+        cache.set(("https://example.com", ""), body)
+        cached = cache.get(("https://example.com", ""))
+    """
+
+    def __init__(self, maxsize: int = 512, ttl: int = 300):
+        """
+        Initialize MemoryCache
+
+        Args:
+            maxsize: Maximum number of entries kept
+            ttl: Default time to live in seconds (0 = don't cache)
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[Hashable, Tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Get value from cache (None if missing or expired)"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[int] = None) -> None:
+        """Set value in cache, overriding the default TTL if given"""
+        ttl = self.ttl if ttl is None else ttl
+        if ttl <= 0:
+            return
+
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Clear all entries"""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
 class CacheManager:
     """
     Simple file-based cache manager (can be replaced with Redis)
@@ -59,15 +120,15 @@ class CacheManager:
             **kwargs: Keyword arguments
 
         Returns:
-            MD5 hash of serialized arguments
+            BLAKE2b hash of serialized arguments
         """
         # Combine all arguments into a string
         key_parts = [str(arg) for arg in args]
         key_parts.extend(f"{k}={v}" for k, v in sorted(kwargs.items()))
         key_string = ":".join(key_parts)
 
-        # Generate MD5 hash
-        return hashlib.md5(key_string.encode()).hexdigest()
+        # Generate 128-bit BLAKE2b hash (faster than MD5, same key length)
+        return hashlib.blake2b(key_string.encode(), digest_size=16).hexdigest()
 
     def get(self, key: str) -> Optional[Any]:
         """
@@ -223,7 +284,7 @@ class RedisCacheManager:
         key_parts = [str(arg) for arg in args]
         key_parts.extend(f"{k}={v}" for k, v in sorted(kwargs.items()))
         key_string = ":".join(key_parts)
-        return hashlib.md5(key_string.encode()).hexdigest()
+        return hashlib.blake2b(key_string.encode(), digest_size=16).hexdigest()
 
     def get(self, key: str) -> Optional[Any]:
         """Get value from Redis cache"""
@@ -2,14 +2,30 @@
 Data Exporter - Export scraped data to various formats
 """
 
+import asyncio
 import json
 import csv
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, AsyncIterable
 import logging
 
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON encoding
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Streamed records are buffered and written in chunks of roughly this size
+STREAM_BUFFER_SIZE = 64 * 1024
+
+
+def _dumps_line(record: Dict[str, Any]) -> bytes:
+    """Serialize a single record as one JSON Lines entry"""
+    if orjson is not None:
+        return orjson.dumps(record, default=str) + b"\n"
+    return json.dumps(record, ensure_ascii=False, default=str).encode('utf-8') + b"\n"
+
 
 class DataExporter:
     """
@@ -42,8 +58,14 @@ class DataExporter:
             filepath = Path(filepath)
             filepath.parent.mkdir(parents=True, exist_ok=True)
 
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=indent, ensure_ascii=ensure_ascii, default=str)
+            # orjson only supports 2-space indentation and always emits UTF-8
+            if orjson is not None and indent in (None, 2) and not ensure_ascii:
+                option = orjson.OPT_INDENT_2 if indent else 0
+                with open(filepath, 'wb') as f:
+                    f.write(orjson.dumps(data, default=str, option=option))
+            else:
+                with open(filepath, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, indent=indent, ensure_ascii=ensure_ascii, default=str)
 
             logger.info(f"Data exported to JSON: {filepath}")
 
@@ -166,6 +188,50 @@ class DataExporter:
             logger.error(f"Failed to export to JSONL: {e}")
             raise
 
+    @staticmethod
+    async def stream_jsonl(
+        records: AsyncIterable[Dict[str, Any]],
+        filepath: str | Path
+    ) -> int:
+        """
+        Stream records to a JSON Lines file as they are produced
+
+        Unlike to_jsonl(), the full result set never has to be held in
+        memory. Records are batched into ~64KB chunks so each write() call
+        (run off the event loop) covers many records.
+
+        Args:
+            records: Async iterable of dictionaries to export
+            filepath: Output file path
+
+        Returns:
+            Number of records written
+        """
+        try:
+            filepath = Path(filepath)
+            filepath.parent.mkdir(parents=True, exist_ok=True)
+
+            count = 0
+            buf = bytearray()
+            with open(filepath, 'wb') as f:
+                async for record in records:
+                    buf += _dumps_line(record)
+                    count += 1
+
+                    if len(buf) >= STREAM_BUFFER_SIZE:
+                        await asyncio.to_thread(f.write, bytes(buf))
+                        buf.clear()
+
+                if buf:
+                    await asyncio.to_thread(f.write, bytes(buf))
+
+            logger.info(f"Streamed {count} records to JSONL: {filepath}")
+            return count
+
+        except Exception as e:
+            logger.error(f"Failed to stream to JSONL: {e}")
+            raise
+
     @staticmethod
     def _flatten_data(data: List[Dict[str, Any]], sep: str = '_') -> List[Dict[str, Any]]:
         """
@@ -208,7 +274,7 @@ class DataExporter:
                 # Recursively flatten nested dictionaries
                 items.update(DataExporter._flatten_dict(v, new_key, sep))
 
-            elif isinstance(v, list):
+            elif isinstance(v, (list, tuple)):
                 if v and isinstance(v[0], dict):
                     # Convert list of dicts to JSON string
                     items[new_key] = json.dumps(v, default=str)
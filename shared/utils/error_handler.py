@@ -4,6 +4,7 @@ Error Handler - Retry logic with exponential backoff
 
 import asyncio
 import logging
+import random
 from functools import wraps
 from typing import Callable, Optional, Type, Tuple
 
@@ -16,7 +17,9 @@ def retry_with_backoff(
     max_delay: float = 60.0,
     exponential_base: float = 2.0,
     exceptions: Tuple[Type[Exception], ...] = (Exception,),
-    on_retry: Optional[Callable] = None
+    on_retry: Optional[Callable] = None,
+    jitter: bool = True,
+    non_retryable: Tuple[Type[Exception], ...] = ()
 ):
     """
     Decorator for retrying async functions with exponential backoff
@@ -28,6 +31,10 @@ def retry_with_backoff(
         exponential_base: Base for exponential backoff calculation
         exceptions: Tuple of exception types to catch
         on_retry: Optional callback function called on each retry
+        jitter: Sleep a random time up to the backoff delay ("full jitter")
+            so concurrent callers don't retry in lockstep
+        non_retryable: Exception types (within ``exceptions``) that are
+            re-raised immediately, e.g. authentication failures
 
     Example:
         @retry_with_backoff(max_retries=3, base_delay=1)
@@ -45,6 +52,9 @@ def retry_with_backoff(
                     return await func(*args, **kwargs)
 
                 except exceptions as e:
+                    if non_retryable and isinstance(e, non_retryable):
+                        raise
+
                     retries += 1
 
                     if retries > max_retries:
@@ -59,6 +69,8 @@ def retry_with_backoff(
                         base_delay * (exponential_base ** (retries - 1)),
                         max_delay
                     )
+                    if jitter:
+                        delay = random.uniform(0, delay)
 
                     logger.warning(
                         f"Error in {func.__name__}: {str(e)}. "
@@ -3,15 +3,18 @@ Rate Limiter - Prevents exceeding rate limits
 """
 
 import asyncio
+import time
 from collections import deque
-from datetime import datetime, timedelta
-from typing import Optional
 
 
 class RateLimiter:
     """
     Async-safe rate limiter using sliding window algorithm
 
+    Request times are kept as integer nanoseconds on the monotonic clock, so
+    hot-path accounting never touches floats or datetimes. No window of
+    time_window seconds ever holds more than max_requests requests.
+
     Example:
         limiter = RateLimiter(max_requests=30, time_window=60)  # 30 req/min
 
@@ -30,51 +33,43 @@ class RateLimiter:
         """
         self.max_requests = max_requests
         self.time_window = time_window
-        self.requests = deque()
+        self._window_ns = time_window * 1_000_000_000
+        self._requests: deque[int] = deque()
         self._lock = asyncio.Lock()
 
+    def _prune(self, now: int) -> None:
+        """Drop requests that have left the window ending at ``now``"""
+        cutoff = now - self._window_ns
+        while self._requests and self._requests[0] <= cutoff:
+            self._requests.popleft()
+
     async def acquire(self) -> None:
         """
         Acquire permission to make a request.
         Will wait if rate limit is reached.
         """
         async with self._lock:
-            now = datetime.utcnow()
-
-            # Remove requests outside the time window
-            while self.requests and self.requests[0] < now - timedelta(seconds=self.time_window):
-                self.requests.popleft()
-
-            # Check if we're at the limit
-            if len(self.requests) >= self.max_requests:
-                # Calculate how long to wait
-                oldest_request = self.requests[0]
-                wait_until = oldest_request + timedelta(seconds=self.time_window)
-                wait_seconds = (wait_until - now).total_seconds()
+            now = time.monotonic_ns()
+            self._prune(now)
 
-                if wait_seconds > 0:
-                    await asyncio.sleep(wait_seconds)
-                    # After waiting, remove old requests again
-                    now = datetime.utcnow()
-                    while self.requests and self.requests[0] < now - timedelta(seconds=self.time_window):
-                        self.requests.popleft()
+            # Sleep until the oldest request leaves the window; the lock keeps
+            # other waiters queued instead of waking them all together
+            while len(self._requests) >= self.max_requests:
+                await asyncio.sleep((self._requests[0] + self._window_ns - now) / 1_000_000_000)
+                now = time.monotonic_ns()
+                self._prune(now)
 
-            # Record this request
-            self.requests.append(datetime.utcnow())
+            self._requests.append(now)
 
     def reset(self) -> None:
         """Clear all request history"""
-        self.requests.clear()
+        self._requests.clear()
 
     @property
     def current_usage(self) -> int:
         """Get current number of requests in the window"""
-        now = datetime.utcnow()
-        # Count requests within time window
-        return sum(
-            1 for req_time in self.requests
-            if req_time >= now - timedelta(seconds=self.time_window)
-        )
+        cutoff = time.monotonic_ns() - self._window_ns
+        return sum(1 for req_time in self._requests if req_time > cutoff)
 
     @property
     def available_requests(self) -> int: